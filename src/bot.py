@@ -1,4 +1,5 @@
 import os
+import logging
 from dotenv import load_dotenv
 from services.discord_handler import AssistantBot, setup_bot_commands
 
@@ -11,6 +12,12 @@ def main():
     Initializes and runs the bot with all available features.
     """
 
+    # WARNING by default; set LOG_LEVEL=DEBUG in .env for full tracebacks
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'WARNING').upper(),
+        format='%(levelname)s %(name)s: %(message)s'
+    )
+
     # Get Discord token from environment
     token = os.getenv('DISCORD_BOT_TOKEN')
 
@@ -1,11 +1,17 @@
 """
 Bot Context and Personality Configuration
 
-This defines Alfred's personality, capabilities, and conversation style.
+This defines Alfred's personality, capabilities, and conversation style,
+plus the Gemini model settings shared by every feature.
 """
 
+import os
+
 BOT_NAME = "Alfred"
 
+# Model used for all routing and parsing
+GEMINI_MODEL = 'gemini-2.5-flash'
+
 BOT_PERSONALITY = """
 You are Alfred, a helpful AI personal assistant available via Discord DMs.
 
@@ -58,6 +64,34 @@ Here's what I can do:
 Just tell me what you need!
     """.strip()
 
+def get_conversation_model():
+    """
+    Get the model used for small talk.
+
+    Small talk only needs a short reply, so GEMINI_CONVERSATION_MODEL in .env
+    can swap in a lighter model (e.g. gemini-2.5-flash-lite) without a code
+    change. Read lazily because .env is loaded after imports in bot.py.
+    """
+    return os.getenv('GEMINI_CONVERSATION_MODEL', GEMINI_MODEL)
+
+def format_context(context):
+    """
+    Format conversation context for inclusion in AI prompts.
+
+    Args:
+        context (list): [(timestamp, role, message), ...] or None
+
+    Returns:
+        str: "Recent conversation:" block, or "" if there is no context
+    """
+    if not context:
+        return ""
+
+    lines = "\n".join(
+        f"{'User' if role == 'user' else 'Alfred'}: {msg}" for _, role, msg in context
+    )
+    return f"\nRecent conversation:\n{lines}\n\n"
+
 def get_system_context():
     """Get the system context for AI features"""
     return BOT_PERSONALITY
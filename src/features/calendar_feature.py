@@ -5,23 +5,122 @@ This is the first feature of the assistant bot. More features can be added
 in separate modules following the same pattern.
 """
 
-import os
-from google import genai
+import logging
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
 from google.genai import types
-from services.calendar_service import create_calendar_event, search_events, modify_event, get_read_service
+from config.bot_context import GEMINI_MODEL, format_context
+from services.gemini_client import get_gemini_client
+from services.calendar_service import create_calendar_events_bulk, search_events, modify_event, get_read_service
+from utils.auth import get_timezone
 
-# Lazy-load Gemini client
-_client = None
+logger = logging.getLogger(__name__)
 
-def _get_client():
-    """Get or create the Gemini client"""
-    global _client
-    if _client is None:
-        api_key = os.getenv('GOOGLE_GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError("GOOGLE_GEMINI_API_KEY not found in environment variables")
-        _client = genai.Client(api_key=api_key)
-    return _client
+def _parse_local_datetime(value):
+    """
+    Parse a Gemini start/end value (local wall time, per the schema).
+
+    Any UTC offset or "Z" Gemini appends is dropped, so the time is still
+    sent with the calendar's timezone instead of being read as UTC.
+    """
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+# Response schema for _parse_calendar_request. Gemini fills this in directly,
+# so the reply is always valid JSON of the expected shape.
+class Reminder(BaseModel):
+    method: Literal['popup', 'email'] = 'popup'
+    minutes: int
+
+
+class Reminders(BaseModel):
+    useDefault: bool = False
+    overrides: list[Reminder] = []
+
+
+class EventDetails(BaseModel):
+    summary: str = Field(description="Brief, clear event title")
+    description: Optional[str] = Field(None, description="Detailed description")
+    start_datetime: str = Field(description="ISO 8601 local time: YYYY-MM-DDTHH:MM (24-hour)")
+    end_datetime: str = Field(description="ISO 8601 local time: YYYY-MM-DDTHH:MM (24-hour)")
+    location: Optional[str] = Field(None, description="Location if mentioned")
+    recurrence: Optional[str] = Field(None, description='RRULE if recurring, must start with "RRULE:"')
+    reminders: Optional[Reminders] = None
+
+
+class EventUpdates(BaseModel):
+    summary: Optional[str] = Field(None, description="New title (if renaming)")
+    description: Optional[str] = Field(None, description="New description (if changing)")
+    location: Optional[str] = Field(None, description="New location (if changing)")
+    reminders: Optional[Reminders] = Field(None, description="New reminders (if adding/changing)")
+
+
+class CalendarRequest(BaseModel):
+    action: Literal['view', 'create', 'modify']
+    start_date: Optional[str] = Field(None, description="VIEW only: YYYY-MM-DD")
+    end_date: Optional[str] = Field(None, description="VIEW only: YYYY-MM-DD")
+    events: Optional[list[EventDetails]] = Field(None, description="CREATE only")
+    search_query: Optional[str] = Field(None, description="MODIFY only: event name/keywords to search for")
+    updates: Optional[EventUpdates] = Field(None, description="MODIFY only: just the fields being changed")
+
+# Static instructions and examples for _parse_calendar_request. Kept as the
+# literal start of every prompt (dynamic parts are appended after it) so
+# Gemini can reuse the cached prefix across requests.
+_CALENDAR_PARSE_PROMPT_PREFIX = """
+You are Alfred's unified calendar request parser. Analyze the user's message and determine if they want to CREATE a new event or MODIFY an existing event.
+
+Use the conversation context below (if any) to understand references like "it", "them", "that event", etc.
+If the user refers to something mentioned earlier, use that information.
+
+Fill in the response schema based on the meaning of the message:
+- VIEW: set "start_date" and "end_date"
+- CREATE: set "events" (one entry per event)
+- MODIFY: set "search_query" and "updates"
+
+VIEW EXAMPLES:
+"What's on my schedule today?"
+→ {"action": "view", "start_date": "2026-02-17", "end_date": "2026-02-17"}
+
+"What do I have tomorrow?"
+→ {"action": "view", "start_date": "2026-02-18", "end_date": "2026-02-18"}
+
+"Show me my events this week"
+→ {"action": "view", "start_date": "2026-02-17", "end_date": "2026-02-23"}
+
+CREATION EXAMPLES:
+"Meeting tomorrow at 3pm"
+→ {"action": "create", "events": [{"summary": "Meeting", "start_datetime": "2026-02-18T15:00", "end_datetime": "2026-02-18T16:00"}]}
+
+"Lunch with Sarah Friday at noon with 1 hour notification"
+→ {"action": "create", "events": [{"summary": "Lunch with Sarah", "start_datetime": "2026-02-21T12:00", "end_datetime": "2026-02-21T13:00", "reminders": {"useDefault": false, "overrides": [{"method": "popup", "minutes": 60}]}}]}
+
+MODIFICATION EXAMPLES:
+"Rename office hours to tutor hours"
+→ {"action": "modify", "search_query": "office hours", "updates": {"summary": "Tutor Hours"}}
+
+"Add a 1 hour notification to CSE 127 makeup office hours"
+→ {"action": "modify", "search_query": "CSE 127 makeup office hours", "updates": {"reminders": {"useDefault": false, "overrides": [{"method": "popup", "minutes": 60}]}}}
+
+"Change team meeting location to Zoom"
+→ {"action": "modify", "search_query": "team meeting", "updates": {"location": "Zoom"}}
+
+IMPORTANT GUIDELINES:
+- VIEW: User is asking what events are scheduled ("what's on...", "what do I have...", "show me...")
+- CREATE: User is scheduling something new ("meeting at...", "I have...", "schedule...")
+- MODIFY: User is changing something existing ("rename...", "change...", "add notification to...", "update...")
+- **CRITICAL**: Calculate dates relative to CURRENT date/time provided below
+  - If today is Tuesday, then "Thursday" = add 2 days
+  - If today is Tuesday, then "next Tuesday" = add 7 days
+  - Always count from the current day of week shown below
+- For CREATE: Parse dates/times relative to current date
+- For CREATE: Use 24-hour format (13:00 for 1 PM)
+- For CREATE: Create brief titles, put details in description
+- For MODIFY: Only include fields being changed in "updates"
+- Reminder minutes: "1 hour" = 60, "30 min" = 30, "15 minutes" = 15
+- Recurrence format: MUST start with "RRULE:" prefix (e.g., "RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20260331T235959Z")
+""".strip()
 
 class CalendarFeature:
     """
@@ -120,9 +219,8 @@ Keywords that indicate this feature: meeting, appointment, schedule, calendar, e
                 )
 
         except Exception as e:
-            print(f"Error in calendar feature: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error in calendar feature: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return f"An error occurred while processing your calendar request: {str(e)}"
 
     async def _parse_calendar_request(self, message_text, context=None):
@@ -137,132 +235,36 @@ Keywords that indicate this feature: meeting, appointment, schedule, calendar, e
             dict: Parsed request with action and relevant data, or None if parsing fails
         """
         try:
-            from datetime import datetime
-            import json
-
-            client = _get_client()
+            client = get_gemini_client()
             now = datetime.now()
             current_context = f"Current date and time: {now.strftime('%A, %Y-%m-%d %H:%M:%S')} (Today is {now.strftime('%A')})"
 
             # Format conversation context
-            context_str = ""
-            if context:
-                context_str = "\nRecent conversation:\n"
-                for timestamp, role, msg in context:
-                    role_label = "User" if role == "user" else "Alfred"
-                    context_str += f"{role_label}: {msg}\n"
-                context_str += "\n"
-
-            prompt = f"""
-{current_context}
-{context_str}
-
-You are Alfred's unified calendar request parser. Analyze the user's message and determine if they want to CREATE a new event or MODIFY an existing event.
-
-User message: "{message_text}"
-
-Use the conversation context above to understand references like "it", "them", "that event", etc.
-If the user refers to something mentioned earlier, use that information.
-
-Based on the meaning of the message, return ONLY valid JSON (no markdown, no explanation):
-
-FOR VIEWING SCHEDULE (asking what's on the calendar):
-{{
-  "action": "view",
-  "start_date": "YYYY-MM-DD",
-  "end_date": "YYYY-MM-DD"
-}}
-
-FOR EVENT CREATION (scheduling new events):
-{{
-  "action": "create",
-  "events": [
-    {{
-      "summary": "Brief, clear event title",
-      "description": "Detailed description (optional)",
-      "start_datetime": "YYYY-MM-DD HH:MM",
-      "end_datetime": "YYYY-MM-DD HH:MM",
-      "location": "Location if mentioned (optional)",
-      "recurrence": "RRULE if recurring (optional)",
-      "reminders": {{
-        "useDefault": false,
-        "overrides": [{{"method": "popup", "minutes": 60}}]
-      }} (optional)
-    }}
-  ]
-}}
-
-FOR EVENT MODIFICATION (changing existing events):
-{{
-  "action": "modify",
-  "search_query": "what to search for (event name/keywords)",
-  "updates": {{
-    "summary": "new title (if renaming)",
-    "description": "new description (if changing)",
-    "location": "new location (if changing)",
-    "reminders": {{
-      "useDefault": false,
-      "overrides": [{{"method": "popup", "minutes": 60}}]
-    }} (if adding/changing reminders)
-  }}
-}}
-
-VIEW EXAMPLES:
-"What's on my schedule today?"
-→ {{"action": "view", "start_date": "2026-02-17", "end_date": "2026-02-17"}}
-
-"What do I have tomorrow?"
-→ {{"action": "view", "start_date": "2026-02-18", "end_date": "2026-02-18"}}
-
-"Show me my events this week"
-→ {{"action": "view", "start_date": "2026-02-17", "end_date": "2026-02-23"}}
-
-CREATION EXAMPLES:
-"Meeting tomorrow at 3pm"
-→ {{"action": "create", "events": [{{"summary": "Meeting", "start_datetime": "2026-02-18 15:00", "end_datetime": "2026-02-18 16:00"}}]}}
-
-"Lunch with Sarah Friday at noon with 1 hour notification"
-→ {{"action": "create", "events": [{{"summary": "Lunch with Sarah", "start_datetime": "2026-02-21 12:00", "end_datetime": "2026-02-21 13:00", "reminders": {{"useDefault": false, "overrides": [{{"method": "popup", "minutes": 60}}]}}}}]}}
-
-MODIFICATION EXAMPLES:
-"Rename office hours to tutor hours"
-→ {{"action": "modify", "search_query": "office hours", "updates": {{"summary": "Tutor Hours"}}}}
-
-"Add a 1 hour notification to CSE 127 makeup office hours"
-→ {{"action": "modify", "search_query": "CSE 127 makeup office hours", "updates": {{"reminders": {{"useDefault": false, "overrides": [{{"method": "popup", "minutes": 60}}]}}}}}}
-
-"Change team meeting location to Zoom"
-→ {{"action": "modify", "search_query": "team meeting", "updates": {{"location": "Zoom"}}}}
-
-IMPORTANT GUIDELINES:
-- VIEW: User is asking what events are scheduled ("what's on...", "what do I have...", "show me...")
-- CREATE: User is scheduling something new ("meeting at...", "I have...", "schedule...")
-- MODIFY: User is changing something existing ("rename...", "change...", "add notification to...", "update...")
-- **CRITICAL**: Calculate dates relative to CURRENT date/time provided above
-  - If today is Tuesday, then "Thursday" = add 2 days
-  - If today is Tuesday, then "next Tuesday" = add 7 days
-  - Always count from the current day of week shown above
-- For CREATE: Parse dates/times relative to current date
-- For CREATE: Use 24-hour format (13:00 for 1 PM)
-- For CREATE: Create brief titles, put details in description
-- For MODIFY: Only include fields being changed in "updates"
-- Reminder minutes: "1 hour" = 60, "30 min" = 30, "15 minutes" = 15
-- Recurrence format: MUST start with "RRULE:" prefix (e.g., "RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20260331T235959Z")
-
-Now parse the message and return ONLY the JSON.
-            """.strip()
+            context_str = format_context(context)
+
+            prompt = (
+                f"{_CALENDAR_PARSE_PROMPT_PREFIX}\n\n"
+                f"{current_context}\n"
+                f"{context_str}\n"
+                f'User message: "{message_text}"\n\n'
+                "Now parse the message and return ONLY the JSON."
+            )
 
-            response = client.models.generate_content(
-                model='gemini-2.5-flash',
+            response = await client.aio.models.generate_content(
+                model=GEMINI_MODEL,
                 contents=prompt,
                 config=types.GenerateContentConfig(
-                    response_mime_type="application/json"
+                    response_mime_type="application/json",
+                    response_schema=CalendarRequest
                 )
             )
-            response_text = response.text.strip()
 
-            # Parse JSON
-            parsed = json.loads(response_text)
+            if response.parsed is None:
+                logger.error("❌ Response didn't match the calendar schema. Raw response: %s", response.text)
+                return None
+
+            # Plain dict with only the fields Gemini filled in
+            parsed = response.parsed.model_dump(exclude_none=True)
 
             action = parsed.get('action')
             print(f"📋 Parsed calendar request: action={action}")
@@ -274,29 +276,22 @@ Now parse the message and return ONLY the JSON.
 
             return parsed
 
-        except json.JSONDecodeError as e:
-            print(f"❌ JSON decode error: {str(e)}")
-            print(f"📝 Raw response: {response_text}")
-            return None
         except Exception as e:
-            print(f"❌ Error parsing calendar request: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ Error parsing calendar request: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return None
 
     async def _handle_creation(self, events_data):
         """Handle creating new calendar events"""
         try:
-            from datetime import datetime
-
             # Convert event data to proper format
             events = []
             for event in events_data:
                 try:
                     parsed_event = {
                         'summary': event.get('summary', 'Untitled Event'),
-                        'start': datetime.strptime(event['start_datetime'], '%Y-%m-%d %H:%M'),
-                        'end': datetime.strptime(event['end_datetime'], '%Y-%m-%d %H:%M'),
+                        'start': _parse_local_datetime(event['start_datetime']),
+                        'end': _parse_local_datetime(event['end_datetime']),
                     }
 
                     # Add optional fields
@@ -317,15 +312,14 @@ Now parse the message and return ONLY the JSON.
             if not events:
                 return "I couldn't parse the event details. Please try again."
 
-            # Create calendar events
+            # Create all calendar events in one batch request
+            results = await asyncio.to_thread(create_calendar_events_bulk, events)
             created_events = []
-            for event_data in events:
-                try:
-                    event = create_calendar_event(event_data)
-                    created_events.append(event)
-                except Exception as e:
-                    print(f"Error creating event: {str(e)}")
-                    continue
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Error creating event: {str(result)}")
+                else:
+                    created_events.append(result)
 
             # Build response
             if created_events:
@@ -333,7 +327,6 @@ Now parse the message and return ONLY the JSON.
                     event = created_events[0]
 
                     # Format times in readable format
-                    from datetime import datetime
                     start_dt = datetime.fromisoformat(event['start'].get('dateTime', event['start'].get('date')))
                     end_dt = datetime.fromisoformat(event['end'].get('dateTime', event['end'].get('date')))
 
@@ -368,7 +361,6 @@ Now parse the message and return ONLY the JSON.
                     return response
                 else:
                     # Multiple events - show details for each
-                    from datetime import datetime
                     event_details = []
                     for event in created_events:
                         start_dt = datetime.fromisoformat(event['start'].get('dateTime', event['start'].get('date')))
@@ -398,29 +390,17 @@ Now parse the message and return ONLY the JSON.
                 return "Sorry, I couldn't create any calendar events. Please try again."
 
         except Exception as e:
-            print(f"Error in event creation: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error in event creation: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return f"An error occurred while creating events: {str(e)}"
 
-    def _format_context(self, context):
-        """Format conversation context for AI prompts"""
-        if not context:
-            return ""
-
-        formatted = "\nRecent conversation:\n"
-        for timestamp, role, msg in context:
-            role_label = "User" if role == "user" else "Alfred"
-            formatted += f"{role_label}: {msg}\n"
-        return formatted + "\n"
-
     async def _handle_modification(self, search_query, updates):
         """Handle requests to modify existing calendar events — confirmation gated."""
         try:
             if not search_query:
                 return "I couldn't understand what events you want to modify. Please be more specific."
 
-            matching_events = search_events(search_query)
+            matching_events = await asyncio.to_thread(search_events, search_query)
 
             if not matching_events:
                 return f"I couldn't find any events matching '{search_query}'."
@@ -452,13 +432,17 @@ Now parse the message and return ONLY the JSON.
             )
 
             async def execute():
+                # Update all matching events concurrently instead of one by one
+                results = await asyncio.gather(
+                    *(asyncio.to_thread(modify_event, event['id'], updates) for event in matching_events),
+                    return_exceptions=True
+                )
                 modified_count = 0
-                for event in matching_events:
-                    try:
-                        modify_event(event['id'], updates)
+                for event, result in zip(matching_events, results):
+                    if isinstance(result, Exception):
+                        print(f"Error modifying event {event.get('summary')}: {str(result)}")
+                    else:
                         modified_count += 1
-                    except Exception as e:
-                        print(f"Error modifying event {event.get('summary')}: {str(e)}")
 
                 if modified_count > 0:
                     recurring_text = "\n🔁 Recurring" if is_recurring else ""
@@ -472,34 +456,25 @@ Now parse the message and return ONLY the JSON.
             return (confirmation_msg, execute)
 
         except Exception as e:
-            print(f"Error in modification handler: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error in modification handler: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return f"An error occurred while modifying events: {str(e)}"
 
     async def _handle_view_schedule(self, start_date, end_date):
         """Handle requests to view schedule (uses readonly service to read ALL calendars)"""
         try:
-            from datetime import datetime, timedelta
-
             if not start_date or not end_date:
                 return "I couldn't understand the date range for viewing your schedule."
 
-            # Get readonly service (can read all calendars)
-            service = get_read_service()
-
-            # Parse dates from AI-provided format (YYYY-MM-DD)
+            # Parse dates from AI-provided ISO format (YYYY-MM-DD)
             # Use local timezone (PST/PDT) for proper date boundaries
-            from zoneinfo import ZoneInfo
-
-            # Get local timezone (defaulting to America/Los_Angeles)
             # TODO: Make this configurable per user or auto-detect
-            local_tz = ZoneInfo('America/Los_Angeles')
+            local_tz = ZoneInfo(get_timezone())
 
             # Create start and end times in local timezone
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d').replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=local_tz)
+            start_dt = datetime.fromisoformat(start_date).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=local_tz)
             # For end date, go to the END of the day (next day at 00:00 local time)
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d').replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=local_tz)
+            end_dt = datetime.fromisoformat(end_date).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=local_tz)
             end_dt = end_dt + timedelta(days=1)  # Go to start of next day in local timezone
 
             # Generate friendly label for date range
@@ -515,49 +490,55 @@ Now parse the message and return ONLY the JSON.
                 # Date range
                 range_label = f"{start_dt.strftime('%b %d')} - {end_dt.strftime('%b %d')}"
 
+            # Calendar API calls block, so they run on worker threads.
+            # Readonly service (can read all calendars), fetched per thread.
+            def list_calendars():
+                return get_read_service().calendarList().list().execute().get('items', [])
+
+            def list_events(calendar_id):
+                # Send timezone-aware timestamps (no 'Z' needed, isoformat includes timezone)
+                events_result = get_read_service().events().list(
+                    calendarId=calendar_id,
+                    timeMin=start_dt.isoformat(),
+                    timeMax=end_dt.isoformat(),
+                    singleEvents=True,
+                    orderBy='startTime'
+                ).execute()
+                return events_result.get('items', [])
+
             # Get list of all calendars
-            calendar_list = service.calendarList().list().execute()
-            calendars = calendar_list.get('items', [])
+            calendars = await asyncio.to_thread(list_calendars)
 
             print(f"📅 Found {len(calendars)} calendars to query")
             print(f"📅 Date range: {start_dt.isoformat()} to {end_dt.isoformat()}")
 
-            # Fetch events from ALL calendars and combine them
+            # Fetch events from ALL calendars concurrently and combine them
+            results = await asyncio.gather(
+                *(asyncio.to_thread(list_events, calendar['id']) for calendar in calendars),
+                return_exceptions=True
+            )
+
             all_events = []
-            for calendar in calendars:
-                calendar_id = calendar['id']
+            for calendar, events in zip(calendars, results):
                 calendar_name = calendar.get('summary', 'Unknown')
 
-                try:
-                    # Send timezone-aware timestamps (no 'Z' needed, isoformat includes timezone)
-                    events_result = service.events().list(
-                        calendarId=calendar_id,
-                        timeMin=start_dt.isoformat(),
-                        timeMax=end_dt.isoformat(),
-                        singleEvents=True,
-                        orderBy='startTime'
-                    ).execute()
-
-                    events = events_result.get('items', [])
-
-                    # Tag each event with its calendar name for context
-                    for event in events:
-                        event['_calendar_name'] = calendar_name
-                        all_events.append(event)
-
-                    print(f"  • {calendar_name}: {len(events)} events")
-
-                except Exception as e:
-                    print(f"  ⚠️ Skipping calendar '{calendar_name}': {str(e)}")
+                if isinstance(events, Exception):
+                    print(f"  ⚠️ Skipping calendar '{calendar_name}': {str(events)}")
                     continue
 
+                # Tag each event with its calendar name for context
+                for event in events:
+                    event['_calendar_name'] = calendar_name
+                    all_events.append(event)
+
+                print(f"  • {calendar_name}: {len(events)} events")
+
             if not all_events:
                 return f"You have no events scheduled for {range_label}."
 
             # Sort all events: all-day events first, then by start time
             def get_event_sort_key(event):
                 """Get sortable key for event (all-day events first, then by time)"""
-                from datetime import timezone
                 start = event['start'].get('dateTime', event['start'].get('date'))
 
                 if 'T' in start:  # datetime event
@@ -565,7 +546,7 @@ Now parse the message and return ONLY the JSON.
                     return (1, datetime.fromisoformat(start.replace('Z', '+00:00')))
                 else:  # all-day event
                     # Return tuple: (0, datetime) - all-day events sort first
-                    naive_dt = datetime.strptime(start, '%Y-%m-%d')
+                    naive_dt = datetime.fromisoformat(start)
                     return (0, naive_dt.replace(tzinfo=timezone.utc))
 
             all_events.sort(key=get_event_sort_key)
@@ -585,7 +566,7 @@ Now parse the message and return ONLY the JSON.
 
             # Format events for display (with date filtering)
             event_lines = []
-            target_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+            target_date = date.fromisoformat(start_date)
 
             print(f"📅 Filtering events for target date: {target_date}")
             print(f"📅 Processing {len(all_events)} events after deduplication:")
@@ -621,7 +602,7 @@ Now parse the message and return ONLY the JSON.
                     else:
                         time_str = start_local.strftime('%I:%M %p').lstrip('0')
                 else:  # all-day event
-                    event_date = datetime.strptime(start, '%Y-%m-%d').date()
+                    event_date = date.fromisoformat(start)
                     print(f"   📌 {summary}: {start} (all-day)")
                     print(f"      Calendar: {calendar_name}")
                     print(f"      Event date: {event_date}, Target: {target_date}")
@@ -649,7 +630,6 @@ Now parse the message and return ONLY the JSON.
             print(f"Error parsing dates: {str(e)}")
             return "I couldn't parse the date range. Please try again."
         except Exception as e:
-            print(f"Error viewing schedule: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error viewing schedule: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return f"An error occurred while viewing your schedule: {str(e)}"
@@ -5,27 +5,35 @@ This feature handles non-task messages while staying true to Alfred's
 task-oriented personality.
 """
 
-import os
-import json
-from google import genai
+import logging
+import orjson
 from google.genai import types
-from config.bot_context import BOT_NAME, get_system_context
-
-# Lazy-load client
-_client = None
-
-def _get_client():
-    """Get or create the Gemini client"""
-    global _client
-    if _client is None:
-        api_key = os.getenv('GOOGLE_GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "GOOGLE_GEMINI_API_KEY not found in environment variables. "
-                "Please set it in your .env file."
-            )
-        _client = genai.Client(api_key=api_key)
-    return _client
+from config.bot_context import BOT_NAME, get_system_context, get_conversation_model, format_context
+from services.gemini_client import get_gemini_client
+
+logger = logging.getLogger(__name__)
+
+# Static reply instructions. Sent right after the personality so the whole
+# prompt prefix is identical for every message.
+_CONVERSATION_INSTRUCTIONS = """
+You are Alfred responding to the user. Keep your response:
+- Under 2-3 sentences
+- Friendly but concise
+- Task-oriented (gently guide toward how you can help)
+- Natural and conversational
+- Use the conversation context below (if any) to provide relevant responses
+- DO NOT address the user as "Alfred" - YOU are Alfred, THEY are the user
+
+If the user is just greeting you or making small talk, respond warmly but briefly offer to help with tasks.
+If they're asking what you can do, explain your calendar capabilities.
+If they're asking deep/philosophical questions, politely redirect to your actual purpose.
+
+Return JSON: {"response": "your reply here"}
+""".strip()
+
+# Personality + instructions never change at runtime, so build that part of
+# the prompt once at import
+_CONVERSATION_PROMPT_PREFIX = f"{get_system_context()}\n\n{_CONVERSATION_INSTRUCTIONS}\n"
 
 class ConversationFeature:
     """
@@ -70,52 +78,26 @@ factual content. Do NOT use it for questions that have a real answer (e.g. "why
             str: Response to send back to the user
         """
         try:
-            client = _get_client()
+            client = get_gemini_client()
 
             # Format context if available
-            context_str = ""
-            if context:
-                context_str = "\nRecent conversation:\n"
-                for timestamp, role, msg in context:
-                    role_label = "User" if role == "user" else "Alfred"
-                    context_str += f"{role_label}: {msg}\n"
-                context_str += "\n"
-
-            # Build prompt with bot context
-            system_context = get_system_context()
-            prompt = f"""
-{system_context}
-{context_str}
-User message: "{message_text}"
-
-You are Alfred responding to the user. Keep your response:
-- Under 2-3 sentences
-- Friendly but concise
-- Task-oriented (gently guide toward how you can help)
-- Natural and conversational
-- Use the conversation context above to provide relevant responses
-- DO NOT address the user as "Alfred" - YOU are Alfred, THEY are the user
+            context_str = format_context(context)
 
-If the user is just greeting you or making small talk, respond warmly but briefly offer to help with tasks.
-If they're asking what you can do, explain your calendar capabilities.
-If they're asking deep/philosophical questions, politely redirect to your actual purpose.
-
-Return JSON: {"response": "your reply here"}
-            """.strip()
+            # Only the per-message parts are built here; the static prefix is pre-rendered
+            prompt = f'{_CONVERSATION_PROMPT_PREFIX}{context_str}\nUser message: "{message_text}"'
 
-            response = client.models.generate_content(
-                model='gemini-2.5-flash',
+            response = await client.aio.models.generate_content(
+                model=get_conversation_model(),
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json"
                 )
             )
 
-            return json.loads(response.text)["response"]
+            return orjson.loads(response.text)["response"]
 
         except Exception as e:
-            print(f"Error in conversation feature: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error in conversation feature: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             # Simple fallback when AI fails
             return f"Hello! I'm {BOT_NAME}, your assistant. I can help with calendar events and more. What would you like to do?"
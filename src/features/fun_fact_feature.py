@@ -4,26 +4,24 @@ Fun Fact Feature - Provides interesting random facts to the user.
 A simple entertainment feature for the assistant bot.
 """
 
-import os
-import json
-from google import genai
+import orjson
 from google.genai import types
+from config.bot_context import GEMINI_MODEL, format_context
+from services.gemini_client import get_gemini_client
 
-# Lazy-load client
-_client = None
-
-def _get_client():
-    """Get or create the Gemini client"""
-    global _client
-    if _client is None:
-        api_key = os.getenv('GOOGLE_GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "GOOGLE_GEMINI_API_KEY not found in environment variables. "
-                "Please set it in your .env file."
-            )
-        _client = genai.Client(api_key=api_key)
-    return _client
+_FUN_FACT_PROMPT = """
+You are Alfred, a knowledgeable assistant. Provide a single interesting fun fact.
+
+Requirements:
+- Keep it brief (2-3 sentences max)
+- Make it genuinely interesting
+- Ensure it's accurate
+- Use a friendly, engaging tone
+- Don't start with "Here's a fun fact" or similar - just state the fact
+- If the conversation context suggests a topic, you can provide a related fact
+
+Return JSON: {"response": "the fun fact here"}
+""".strip()
 
 class FunFactFeature:
     """
@@ -70,40 +68,22 @@ Examples of what this feature handles:
             str: A fun fact
         """
         try:
-            client = _get_client()
+            client = get_gemini_client()
 
             # Format conversation context if available
-            context_str = ""
-            if context:
-                context_str = "\nRecent conversation:\n"
-                for timestamp, role, msg in context:
-                    role_label = "User" if role == "user" else "Alfred"
-                    context_str += f"{role_label}: {msg}\n"
-                context_str += "\n"
+            context_str = format_context(context)
 
-            prompt = f"""
-{context_str}You are Alfred, a knowledgeable assistant. Provide a single interesting fun fact.
-
-Requirements:
-- Keep it brief (2-3 sentences max)
-- Make it genuinely interesting
-- Ensure it's accurate
-- Use a friendly, engaging tone
-- Don't start with "Here's a fun fact" or similar - just state the fact
-- If the conversation context suggests a topic, you can provide a related fact
-
-Return JSON: {"response": "the fun fact here"}
-            """.strip()
+            prompt = f"{_FUN_FACT_PROMPT}\n{context_str}"
 
-            response = client.models.generate_content(
-                model='gemini-2.5-flash',
+            response = await client.aio.models.generate_content(
+                model=GEMINI_MODEL,
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json"
                 )
             )
 
-            return json.loads(response.text)["response"]
+            return orjson.loads(response.text)["response"]
 
         except Exception as e:
             print(f"Error in fun fact feature: {str(e)}")
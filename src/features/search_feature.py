@@ -5,22 +5,31 @@ Handles general knowledge queries, current information lookups, and multi-step
 reasoning questions. Uses Gemini's built-in Google Search tool — no extra API key needed.
 """
 
-import os
-import json
-from google import genai
+import logging
+import orjson
 from google.genai import types
-from config.bot_context import get_system_context
+from config.bot_context import get_system_context, GEMINI_MODEL, format_context
+from services.gemini_client import get_gemini_client
 
-_client = None
+logger = logging.getLogger(__name__)
 
-def _get_client():
-    global _client
-    if _client is None:
-        api_key = os.getenv('GOOGLE_GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError("GOOGLE_GEMINI_API_KEY not found in environment variables")
-        _client = genai.Client(api_key=api_key)
-    return _client
+_SEARCH_INSTRUCTIONS = """
+The user is asking a question that requires a factual or researched answer.
+Use Google Search if you need current or specific information.
+
+Answer clearly and concisely:
+- A few sentences for simple questions
+- More detail for complex or multi-part questions
+- Use plain prose, not bullet points, unless listing things is genuinely clearer
+- Do not add filler like "Great question!" or "Certainly!"
+- Do not mention that you searched or used any tools
+- Just give the answer directly
+
+Return JSON: {"response": "your answer here"}
+""".strip()
+
+# Static part of the prompt; only the context and question change per call
+_SEARCH_PROMPT_PREFIX = f"{get_system_context()}\n\n{_SEARCH_INSTRUCTIONS}\n"
 
 
 class SearchFeature:
@@ -70,39 +79,14 @@ informative answer — as opposed to casual small talk or task actions (calendar
 
     async def handle(self, message, message_text, context=None):
         try:
-            client = _get_client()
-
-            context_str = ""
-            if context:
-                context_str = "\nRecent conversation:\n"
-                for timestamp, role, msg in context:
-                    role_label = "User" if role == "user" else "Alfred"
-                    context_str += f"{role_label}: {msg}\n"
-                context_str += "\n"
+            client = get_gemini_client()
 
-            system_context = get_system_context()
+            context_str = format_context(context)
 
-            prompt = f"""
-{system_context}
-{context_str}
-The user is asking a question that requires a factual or researched answer.
-Use Google Search if you need current or specific information.
-
-User question: "{message_text}"
-
-Answer clearly and concisely:
-- A few sentences for simple questions
-- More detail for complex or multi-part questions
-- Use plain prose, not bullet points, unless listing things is genuinely clearer
-- Do not add filler like "Great question!" or "Certainly!"
-- Do not mention that you searched or used any tools
-- Just give the answer directly
-
-Return JSON: {"response": "your answer here"}
-            """.strip()
+            prompt = f'{_SEARCH_PROMPT_PREFIX}\n{context_str}User question: "{message_text}"'
 
-            response = client.models.generate_content(
-                model='gemini-2.5-flash',
+            response = await client.aio.models.generate_content(
+                model=GEMINI_MODEL,
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     tools=[types.Tool(google_search=types.GoogleSearch())],
@@ -110,10 +94,9 @@ Return JSON: {"response": "your answer here"}
                 )
             )
 
-            return json.loads(response.text)["response"]
+            return orjson.loads(response.text)["response"]
 
         except Exception as e:
-            print(f"Error in search feature: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error in search feature: %s", e)
+            logger.debug("Traceback:", exc_info=True)
             return f"I ran into an issue while searching for that. Try rephrasing your question."
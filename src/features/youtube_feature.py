@@ -7,28 +7,15 @@ Supports multiple URLs in a single request.
 
 import os
 import re
+import asyncio
 import tempfile
-import json
+import orjson
 from pathlib import Path
 import discord
 import yt_dlp
-from google import genai
-
-# Lazy-load client to ensure env vars are loaded first
-_client = None
-
-def _get_client():
-    """Get or create the Gemini client"""
-    global _client
-    if _client is None:
-        api_key = os.getenv('GOOGLE_GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "GOOGLE_GEMINI_API_KEY not found in environment variables. "
-                "Please set it in your .env file."
-            )
-        _client = genai.Client(api_key=api_key)
-    return _client
+from google.genai import types
+from config.bot_context import GEMINI_MODEL, format_context
+from services.gemini_client import get_gemini_client
 
 
 class YouTubeFeature:
@@ -174,13 +161,7 @@ class YouTubeFeature:
             dict: {'downloads': [{'url': str, 'format': str, 'time_range': dict or None}, ...]}
         """
         # Format context if available
-        context_str = ""
-        if context:
-            context_str = "\nRecent conversation:\n"
-            for timestamp, role, msg in context:
-                role_label = "User" if role == "user" else "Alfred"
-                context_str += f"{role_label}: {msg}\n"
-            context_str += "\n"
+        context_str = format_context(context)
 
         prompt = f"""
 {context_str}
@@ -239,21 +220,17 @@ Response: {{"downloads": [{{"url": "link1", "format": "mp4", "time_range": {{"st
 """
 
         try:
-            client = _get_client()
-            response = client.models.generate_content(
-                model='gemini-2.5-flash',
-                contents=prompt
+            client = get_gemini_client()
+            response = await client.aio.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json"
+                )
             )
-            response_text = response.text.strip()
-
-            # Clean up response (remove markdown if present)
-            if response_text.startswith('```json'):
-                response_text = response_text.split('```json')[1].split('```')[0].strip()
-            elif response_text.startswith('```'):
-                response_text = response_text.split('```')[1].split('```')[0].strip()
 
-            # Parse JSON
-            result = json.loads(response_text)
+            # JSON mode returns bare JSON (no markdown fences to strip)
+            result = orjson.loads(response.text)
 
             return result
 
@@ -334,14 +311,15 @@ Response: {{"downloads": [{{"url": "link1", "format": "mp4", "time_range": {{"st
         if postprocessors:
             ydl_opts['postprocessors'] = postprocessors
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Download and get info
-            info = ydl.extract_info(url, download=True)
+        def run_download():
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                # Download and get info
+                info = ydl.extract_info(url, download=True)
 
-            # Get the actual filename
-            if format_type == 'mp3':
-                filename = ydl.prepare_filename(info).rsplit('.', 1)[0] + '.mp3'
-            else:
-                filename = ydl.prepare_filename(info)
+                # Get the actual filename
+                if format_type == 'mp3':
+                    return ydl.prepare_filename(info).rsplit('.', 1)[0] + '.mp3'
+                return ydl.prepare_filename(info)
 
-            return filename
+        # yt-dlp + ffmpeg block for the whole download, so keep them off the event loop
+        return await asyncio.to_thread(run_download)
@@ -1,11 +1,17 @@
+import logging
 import os
 import pickle
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+import orjson
+from utils.auth import get_timezone
+
+logger = logging.getLogger(__name__)
+
+# Google auth/API client libraries are imported inside the functions that
+# use them: they pull in hundreds of modules and aren't needed until the
+# first real Calendar call (InstalledAppFlow only on first-time login).
 
 # Scopes for dual authentication approach
 # User scope: Read-only access to all calendars (for viewing schedule)
@@ -21,54 +27,163 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 # User credentials (for reading all calendars)
 USER_CREDENTIALS_PATH = PROJECT_ROOT / 'credentials' / 'user_credentials.json'
-USER_TOKEN_PATH = PROJECT_ROOT / 'user_token.pickle'
+USER_TOKEN_PATH = PROJECT_ROOT / 'user_token.json'
 
 # Bot credentials (for writing to bot calendar only)
 BOT_CREDENTIALS_PATH = PROJECT_ROOT / 'credentials' / 'bot_credentials.json'
-BOT_TOKEN_PATH = PROJECT_ROOT / 'bot_token.pickle'
+BOT_TOKEN_PATH = PROJECT_ROOT / 'bot_token.json'
 
-def _get_service(credentials_path, token_path, scopes, service_type="calendar"):
+# Timezone sent with every event start/end, resolved once at import
+_EVENT_TZ = {'timeZone': get_timezone()}
+
+# Loaded OAuth credentials, keyed by token path (shared by all threads)
+_creds_cache = {}
+_creds_lock = threading.Lock()
+
+# googleapiclient JSON model that parses responses with orjson, created on first use
+_json_model = None
+
+# Built Calendar services, one set per thread. A service wraps an
+# httplib2.Http, which isn't thread-safe, and calendar_feature runs
+# create/modify calls concurrently on worker threads.
+_thread_local = threading.local()
+
+def _read_token(token_path, scopes):
     """
-    Generic authentication function for both user and bot credentials.
+    Read stored credentials from a JSON token file.
+
+    Tokens from older installs were pickled next to the JSON path; those are
+    converted once, since they can't be regenerated without a browser login.
+
+    Returns:
+        Credentials, or None if no token has been saved yet
+    """
+    from google.oauth2.credentials import Credentials
+
+    if token_path.exists():
+        with open(token_path, 'rb') as token:
+            return Credentials.from_authorized_user_info(orjson.loads(token.read()), scopes)
+
+    legacy_path = token_path.with_suffix('.pickle')
+    if legacy_path.exists():
+        with open(legacy_path, 'rb') as token:
+            creds = pickle.load(token)
+        _write_token(token_path, creds)
+        return creds
+
+    return None
+
+def _write_token(token_path, creds):
+    """Save credentials (including the refresh token) as JSON."""
+    with open(token_path, 'wb') as token:
+        token.write(creds.to_json().encode())
+
+def _load_credentials(credentials_path, token_path, scopes, service_type="calendar"):
+    """
+    Load (and refresh or create, if needed) OAuth credentials.
+
+    Credentials are cached in memory so the token file is only read on the
+    first call and re-written when a refresh happens.
 
     Args:
         credentials_path: Path to credentials JSON file
-        token_path: Path to store token pickle
+        token_path: Path to store token JSON
         scopes: List of OAuth scopes
         service_type: Type of service ("user" or "bot") for error messages
 
     Returns:
-        Google Calendar service instance
+        Valid google.oauth2 Credentials
+    """
+    with _creds_lock:
+        creds = _creds_cache.get(token_path)
+        if creds and creds.valid:
+            return creds
+
+        # Token file stores access and refresh tokens
+        if creds is None:
+            creds = _read_token(token_path, scopes)
+
+        # If no valid credentials, let user log in
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                from google.auth.transport.requests import Request
+                creds.refresh(Request())
+            else:
+                # Need credentials.json from Google Cloud Console
+                if not credentials_path.exists():
+                    raise FileNotFoundError(
+                        f"{service_type.title()} credentials not found at {credentials_path}\n"
+                        f"Please download OAuth credentials from Google Cloud Console\n"
+                        f"and save to: {credentials_path}"
+                    )
+
+                from google_auth_oauthlib.flow import InstalledAppFlow
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    str(credentials_path), scopes)
+                creds = flow.run_local_server(port=0)
+
+            # Save credentials for next run
+            _write_token(token_path, creds)
+
+        _creds_cache[token_path] = creds
+        return creds
+
+def _get_json_model():
     """
-    creds = None
+    Get a googleapiclient JsonModel that parses responses with orjson.
 
-    # Token file stores access and refresh tokens
-    if token_path.exists():
-        with open(token_path, 'rb') as token:
-            creds = pickle.load(token)
+    Event listings can be large, and the stock model parses them with the
+    stdlib json module. Request bodies are small and keep the stock
+    (ASCII-escaped) encoder, which batch requests rely on.
+    """
+    global _json_model
+    if _json_model is None:
+        from googleapiclient.model import JsonModel
 
-    # If no valid credentials, let user log in
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            # Need credentials.json from Google Cloud Console
-            if not credentials_path.exists():
-                raise FileNotFoundError(
-                    f"{service_type.title()} credentials not found at {credentials_path}\n"
-                    f"Please download OAuth credentials from Google Cloud Console\n"
-                    f"and save to: {credentials_path}"
-                )
+        class OrjsonModel(JsonModel):
+            def deserialize(self, content):
+                try:
+                    return orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # Non-JSON bodies are handled (passed through) by the base model
+                    return super().deserialize(content)
+
+        _json_model = OrjsonModel()
+    return _json_model
+
+def _get_service(credentials_path, token_path, scopes, service_type="calendar"):
+    """
+    Generic authentication function for both user and bot credentials.
 
-            flow = InstalledAppFlow.from_client_secrets_file(
-                str(credentials_path), scopes)
-            creds = flow.run_local_server(port=0)
+    The built service is reused for later calls on the same thread, so the
+    token file and discovery document aren't re-read on every request.
 
-        # Save credentials for next run
-        with open(token_path, 'wb') as token:
-            pickle.dump(creds, token)
+    Args:
+        credentials_path: Path to credentials JSON file
+        token_path: Path to store token JSON
+        scopes: List of OAuth scopes
+        service_type: Type of service ("user" or "bot") for error messages
 
-    service = build('calendar', 'v3', credentials=creds)
+    Returns:
+        Google Calendar service instance
+    """
+    services = getattr(_thread_local, 'services', None)
+    if services is None:
+        services = _thread_local.services = {}
+
+    key = (str(credentials_path), tuple(scopes))
+    cached = services.get(key)
+    if cached is not None:
+        service, creds = cached
+        if creds.valid:
+            return service
+
+    from googleapiclient.discovery import build
+
+    creds = _load_credentials(credentials_path, token_path, scopes, service_type)
+    service = build('calendar', 'v3', credentials=creds, static_discovery=True,
+                    model=_get_json_model())
+    services[key] = (service, creds)
     return service
 
 def get_read_service():
@@ -107,38 +222,12 @@ def get_calendar_service():
     """
     return get_write_service()
 
-def create_calendar_event(event_data):
-    """
-    Create a calendar event in bot calendar.
-
-    Args:
-        event_data (dict): Event details with structure:
-            {
-                'summary': str (required),
-                'description': str (optional),
-                'start': datetime (required),
-                'end': datetime (required),
-                'location': str (optional),
-                'recurrence': str (optional) - RRULE format,
-                'reminders': dict (optional) - reminder configuration
-            }
-
-    Returns:
-        dict: Created event from Google Calendar API
-    """
-    service = get_write_service()
-
-    # Build event object for Google Calendar API
+def _build_event_body(event_data):
+    """Build the Google Calendar API event body for create_calendar_event(s)."""
     event = {
         'summary': event_data['summary'],
-        'start': {
-            'dateTime': event_data['start'].isoformat(),
-            'timeZone': 'America/Los_Angeles',  # Change to your timezone
-        },
-        'end': {
-            'dateTime': event_data['end'].isoformat(),
-            'timeZone': 'America/Los_Angeles',  # Change to your timezone
-        },
+        'start': {'dateTime': event_data['start'].isoformat(), **_EVENT_TZ},
+        'end': {'dateTime': event_data['end'].isoformat(), **_EVENT_TZ},
     }
 
     # Add optional fields
@@ -153,26 +242,96 @@ def create_calendar_event(event_data):
         # Google Calendar expects recurrence as a list of RRULE strings
         recurrence_rule = event_data['recurrence']
         event['recurrence'] = [recurrence_rule]
-        print(f"📅 Adding recurrence: {recurrence_rule}")
+        logger.debug("Adding recurrence: %s", recurrence_rule)
 
     # Add reminders if specified
     if 'reminders' in event_data:
         event['reminders'] = event_data['reminders']
-        print(f"🔔 Adding reminders: {event_data['reminders']}")
+        logger.debug("Adding reminders: %s", event_data['reminders'])
     else:
         # Use default reminders if none specified
         event['reminders'] = {'useDefault': True}
 
+    return event
+
+def create_calendar_event(event_data):
+    """
+    Create a calendar event in bot calendar.
+
+    Args:
+        event_data (dict): Event details with structure:
+            {
+                'summary': str (required),
+                'description': str (optional),
+                'start': datetime (required),
+                'end': datetime (required),
+                'location': str (optional),
+                'recurrence': str (optional) - RRULE format,
+                'reminders': dict (optional) - reminder configuration
+            }
+
+    Returns:
+        dict: Created event from Google Calendar API
+    """
+    service = get_write_service()
+
     # Create the event
     calendar_id = os.getenv('GOOGLE_CALENDAR_ID', 'primary')
     created_event = service.events().insert(
         calendarId=calendar_id,
-        body=event
+        body=_build_event_body(event_data)
     ).execute()
 
-    print(f"Event created: {created_event.get('htmlLink')}")
+    logger.debug("Event created: %s", created_event.get('htmlLink'))
     return created_event
 
+# Google's batch endpoint accepts at most 50 calls per request
+_BATCH_LIMIT = 50
+
+def create_calendar_events_bulk(events_data):
+    """
+    Create several calendar events in bot calendar with one batch request.
+
+    Args:
+        events_data (list): Event dicts, same structure as create_calendar_event()
+
+    Returns:
+        list: Per event (in order), the created event dict or the Exception
+              raised for that event
+    """
+    service = get_write_service()
+    calendar_id = os.getenv('GOOGLE_CALENDAR_ID', 'primary')
+    results = [None] * len(events_data)
+
+    def on_response(request_id, response, exception):
+        results[int(request_id)] = exception if exception is not None else response
+
+    for offset in range(0, len(events_data), _BATCH_LIMIT):
+        chunk = range(offset, min(offset + _BATCH_LIMIT, len(events_data)))
+        try:
+            batch = service.new_batch_http_request(callback=on_response)
+            for i in chunk:
+                batch.add(
+                    service.events().insert(calendarId=calendar_id, body=_build_event_body(events_data[i])),
+                    request_id=str(i)
+                )
+            batch.execute()
+        except Exception as e:
+            # Transport/auth failure for this chunk: earlier chunks' events
+            # exist, so report the failure per event instead of raising
+            for i in chunk:
+                if results[i] is None:
+                    results[i] = e
+
+    logger.debug("Batch created %d event(s)", sum(not isinstance(r, Exception) for r in results))
+    return results
+
+def _to_rfc3339(dt):
+    """Convert datetime to RFC3339 string with Z suffix (naive = UTC)."""
+    u = dt.astimezone(timezone.utc) if dt.tzinfo is not None else dt
+    # Plain integer formatting: no strftime/locale, same on every platform
+    return f"{u.year:04d}-{u.month:02d}-{u.day:02d}T{u.hour:02d}:{u.minute:02d}:{u.second:02d}Z"
+
 def search_events(query, max_results=100, time_min=None, time_max=None):
     """
     Search for calendar events in bot calendar by text query.
@@ -193,12 +352,6 @@ def search_events(query, max_results=100, time_min=None, time_max=None):
     if time_min is None:
         time_min = datetime.now(timezone.utc)
 
-    def _to_rfc3339(dt):
-        """Convert datetime to RFC3339 string with Z suffix, works on all platforms."""
-        if dt.tzinfo is not None:
-            return dt.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        return dt.strftime('%Y-%m-%dT%H:%M:%SZ')  # assume UTC if naive
-
     params = {
         'calendarId': calendar_id,
         'q': query,  # Free text search
@@ -214,7 +367,7 @@ def search_events(query, max_results=100, time_min=None, time_max=None):
     events_result = service.events().list(**params).execute()
     events = events_result.get('items', [])
 
-    print(f"🔍 Found {len(events)} event(s) matching '{query}'")
+    logger.debug("Found %d event(s) matching %r", len(events), query)
     return events
 
 
@@ -253,16 +406,10 @@ def modify_event(event_id, updates):
         event['location'] = updates['location']
 
     if 'start' in updates:
-        event['start'] = {
-            'dateTime': updates['start'].isoformat(),
-            'timeZone': 'America/Los_Angeles',
-        }
+        event['start'] = {'dateTime': updates['start'].isoformat(), **_EVENT_TZ}
 
     if 'end' in updates:
-        event['end'] = {
-            'dateTime': updates['end'].isoformat(),
-            'timeZone': 'America/Los_Angeles',
-        }
+        event['end'] = {'dateTime': updates['end'].isoformat(), **_EVENT_TZ}
 
     if 'recurrence' in updates:
         event['recurrence'] = [updates['recurrence']]
@@ -277,7 +424,7 @@ def modify_event(event_id, updates):
         body=event
     ).execute()
 
-    print(f"✏️ Event updated: {updated_event.get('htmlLink')}")
+    logger.debug("Event updated: %s", updated_event.get('htmlLink'))
     return updated_event
 
 
@@ -293,7 +440,7 @@ def list_upcoming_events(max_results=10):
     """
     service = get_calendar_service()
 
-    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    now = _to_rfc3339(datetime.now(timezone.utc))
     events_result = service.events().list(
         calendarId='primary',
         timeMin=now,
@@ -1,9 +1,10 @@
 import os
+import asyncio
+import orjson
 import discord
 from discord.ext import commands
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
-from google import genai
 from google.genai import types
 from features.calendar_feature import CalendarFeature
 from features.conversation_feature import ConversationFeature
@@ -11,15 +12,8 @@ from features.fun_fact_feature import FunFactFeature
 from features.youtube_feature import YouTubeFeature
 from features.search_feature import SearchFeature
 from services.intent_router import IntentRouter
-from config.bot_context import BOT_NAME, get_bot_intro
-
-_gemini_client = None
-
-def _get_gemini_client():
-    global _gemini_client
-    if _gemini_client is None:
-        _gemini_client = genai.Client(api_key=os.getenv('GOOGLE_GEMINI_API_KEY'))
-    return _gemini_client
+from config.bot_context import BOT_NAME, get_bot_intro, GEMINI_MODEL
+from services.gemini_client import get_gemini_client
 
 class AssistantBot(commands.Bot):
     """
@@ -142,33 +136,13 @@ class AssistantBot(commands.Bot):
 
         return recent_messages
 
-    def _format_context_for_prompt(self, context):
-        """
-        Format conversation context for inclusion in AI prompts.
-
-        Args:
-            context: List of (timestamp, role, message) tuples
-
-        Returns:
-            str: Formatted context string
-        """
-        if not context:
-            return ""
-
-        formatted = "Recent conversation:\n"
-        for timestamp, role, message in context:
-            role_label = "User" if role == "user" else "Alfred"
-            formatted += f"{role_label}: {message}\n"
-
-        return formatted
-
     async def _classify_confirmation(self, message_text: str) -> str:
         """
         Returns 'confirm', 'cancel', or 'other'.
         Called only when a pending destructive action exists for the user.
         """
         try:
-            client = _get_gemini_client()
+            client = get_gemini_client()
             prompt = (
                 f'A user was asked to confirm or cancel a pending action. '
                 f'Their reply: "{message_text}"\n\n'
@@ -176,15 +150,14 @@ class AssistantBot(commands.Bot):
                 f'{{"classification": "cancel"}} if they decline, or '
                 f'{{"classification": "other"}} if the message is unrelated to a confirmation.'
             )
-            response = client.models.generate_content(
-                model='gemini-2.5-flash',
+            response = await client.aio.models.generate_content(
+                model=GEMINI_MODEL,
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json"
                 )
             )
-            import json
-            result = json.loads(response.text).get("classification", "other")
+            result = orjson.loads(response.text).get("classification", "other")
             if result in ('confirm', 'cancel', 'other'):
                 return result
             return 'other'
@@ -281,7 +254,8 @@ class AssistantBot(commands.Bot):
                     self.pending_actions.pop(user_id)
 
             # Use AI to determine which feature should handle this
-            handler = self.router.route(message_text, context=context)
+            # (router is synchronous, so run it off the event loop)
+            handler = await asyncio.to_thread(self.router.route, message_text, context=context)
 
             if handler:
                 print(f"🤖 AI Router selected: {handler.name}")
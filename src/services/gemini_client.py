@@ -0,0 +1,30 @@
+"""
+Gemini Client
+
+The single google-genai client shared by every feature, the router, and the
+Discord handler, so they all share one HTTP connection pool.
+"""
+
+import os
+from google import genai
+
+# Lazy-load client to ensure env vars are loaded first
+_gemini_client = None
+
+def get_gemini_client():
+    """
+    Get or create the process-wide Gemini client.
+
+    Raises:
+        ValueError: If GOOGLE_GEMINI_API_KEY is not set
+    """
+    global _gemini_client
+    if _gemini_client is None:
+        api_key = os.getenv('GOOGLE_GEMINI_API_KEY')
+        if not api_key:
+            raise ValueError(
+                "GOOGLE_GEMINI_API_KEY not found in environment variables. "
+                "Please set it in your .env file."
+            )
+        _gemini_client = genai.Client(api_key=api_key)
+    return _gemini_client
@@ -6,26 +6,32 @@ Instead of keyword matching, the AI understands what the user wants to do and
 routes to the correct feature handler.
 """
 
-import os
+import logging
 import json
-from google import genai
+import orjson
 from google.genai import types
+from config.bot_context import GEMINI_MODEL, format_context
+from services.gemini_client import get_gemini_client
 
-# Lazy-load client to ensure env vars are loaded first
-_client = None
-
-def _get_client():
-    """Get or create the Gemini client"""
-    global _client
-    if _client is None:
-        api_key = os.getenv('GOOGLE_GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "GOOGLE_GEMINI_API_KEY not found in environment variables. "
-                "Please set it in your .env file."
-            )
-        _client = genai.Client(api_key=api_key)
-    return _client
+logger = logging.getLogger(__name__)
+
+# Routing rules and examples, shared by the single-message and batch prompts
+_ROUTING_RULES = """Rules:
+1. Analyze what the user is trying to accomplish
+2. Consider the recent conversation (if any) to understand references like "it", "that", "the event"
+3. Match their intent to the most appropriate feature
+4. Consider the capabilities and examples of each feature
+5. If the message doesn't clearly match any feature, return feature_index: null
+6. Be generous with calendar - if someone mentions time/date/event, it's probably calendar
+"""
+
+_ROUTING_EXAMPLES = """Examples:
+- "Meeting tomorrow at 3pm" → calendar feature (high confidence)
+- After creating event, user says "make it 2 hours" → calendar feature (using context)
+- "Remind me to call mom" → reminder feature if available, else null
+- "What's the weather?" → weather feature if available, else null
+- "Random chat message" → conversation feature (low confidence)
+"""
 
 class IntentRouter:
     """
@@ -34,6 +40,10 @@ class IntentRouter:
 
     def __init__(self):
         self.features = []
+        # Static part of the routing prompt (instructions + feature menu),
+        # rebuilt only when a feature is registered
+        self._features_json = "[]"
+        self._prompt_prefix = self._build_routing_prefix(self._features_json)
 
     def register_feature(self, feature):
         """
@@ -44,6 +54,20 @@ class IntentRouter:
         """
         self.features.append(feature)
 
+        # Names and capabilities don't change at runtime, so serialize the
+        # routing menu and build the prompt around it once here instead of
+        # on every message
+        feature_descriptions = []
+        for i, registered in enumerate(self.features):
+            feature_descriptions.append({
+                "index": i,
+                "name": registered.name,
+                "description": registered.description,
+                "capabilities": registered.get_capabilities()
+            })
+        self._features_json = json.dumps(feature_descriptions, indent=2)
+        self._prompt_prefix = self._build_routing_prefix(self._features_json)
+
     def route(self, message_text, context=None):
         """
         Use AI to determine which feature should handle this message.
@@ -58,24 +82,14 @@ class IntentRouter:
         if not self.features:
             return None
 
-        # Build feature descriptions for the AI
-        feature_descriptions = []
-        for i, feature in enumerate(self.features):
-            feature_descriptions.append({
-                "index": i,
-                "name": feature.name,
-                "description": feature.description,
-                "capabilities": feature.get_capabilities()
-            })
-
         # Create prompt for Gemini
-        prompt = self._build_routing_prompt(message_text, feature_descriptions, context=context)
+        prompt = self._build_routing_prompt(message_text, context=context)
 
         try:
             # Ask Gemini which feature should handle this
-            client = _get_client()
+            client = get_gemini_client()
             response = client.models.generate_content(
-                model='gemini-2.5-flash',
+                model=GEMINI_MODEL,
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json"
@@ -84,7 +98,7 @@ class IntentRouter:
             response_text = response.text.strip()
 
             # Parse JSON response
-            result = json.loads(response_text)
+            result = orjson.loads(response_text)
 
             feature_index = result.get('feature_index')
             confidence = result.get('confidence', 0)
@@ -98,9 +112,8 @@ class IntentRouter:
 
         except Exception as e:
             error_str = str(e)
-            print(f"Error in intent routing: {error_str}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error in intent routing: %s", error_str)
+            logger.debug("Traceback:", exc_info=True)
 
             # Check if it's a rate limit error
             if '429' in error_str or 'RESOURCE_EXHAUSTED' in error_str or 'quota' in error_str.lower():
@@ -110,47 +123,80 @@ class IntentRouter:
             # No fallback - if AI routing fails, we fail gracefully
             return None
 
-    def _build_routing_prompt(self, message_text, feature_descriptions, context=None):
+    def route_batch(self, messages):
         """
-        Build the prompt for Gemini to route the message.
+        Route several unrelated messages with a single Gemini call.
+
+        Meant for routing many standalone messages at once (e.g. the router
+        tests); messages are routed without conversation context. Any message
+        the reply doesn't cover cleanly is re-routed on its own with route().
 
         Args:
-            message_text (str): User's message
-            feature_descriptions (list): List of feature metadata
-            context (list): Optional conversation context
+            messages (list): The user messages (str)
 
         Returns:
-            str: Prompt for Gemini
+            list: Feature instance or None for each message, in order
         """
-        features_json = json.dumps(feature_descriptions, indent=2)
+        results = [None] * len(messages)
+        if not self.features or not messages:
+            return results
 
-        # Format context if available
-        context_str = ""
-        if context:
-            context_str = "\nRecent conversation:\n"
-            for timestamp, role, msg in context:
-                role_label = "User" if role == "user" else "Alfred"
-                context_str += f"{role_label}: {msg}\n"
-            context_str += "\n"
-
-        prompt = f"""
+        routed = set()
+        try:
+            client = get_gemini_client()
+            response = client.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=self._build_batch_routing_prompt(messages),
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json"
+                )
+            )
+
+            for item in orjson.loads(response.text).get('results', []):
+                message_index = item.get('message_index')
+                feature_index = item.get('feature_index')
+                if not isinstance(message_index, int) or not 0 <= message_index < len(messages):
+                    continue
+                if feature_index is not None and not (
+                    isinstance(feature_index, int) and 0 <= feature_index < len(self.features)
+                ):
+                    continue
+
+                # Same confidence threshold as route()
+                if feature_index is not None and item.get('confidence', 0) >= 0.6:
+                    results[message_index] = self.features[feature_index]
+                routed.add(message_index)
+
+        except Exception as e:
+            logger.error("Error in batch intent routing: %s", e)
+            logger.debug("Traceback:", exc_info=True)
+
+        # Fall back to one call per message for anything missing or malformed
+        for i, message_text in enumerate(messages):
+            if i not in routed:
+                results[i] = self.route(message_text)
+
+        return results
+
+    def _build_routing_prefix(self, features_json):
+        """
+        Build the part of the routing prompt that is the same for every message.
+
+        Args:
+            features_json (str): Serialized feature metadata
+
+        Returns:
+            str: Routing instructions followed by the feature menu
+        """
+        return f"""
 You are an intelligent routing system for a personal assistant bot.
-{context_str}
-User message: "{message_text}"
 
 Available features:
 {features_json}
 
-Your task: Determine which feature should handle this user's message.
-
-Rules:
-1. Analyze what the user is trying to accomplish
-2. Consider the conversation context above (if any) to understand references like "it", "that", "the event"
-3. Match their intent to the most appropriate feature
-4. Consider the capabilities and examples of each feature
-5. If the message doesn't clearly match any feature, return feature_index: null
-6. Be generous with calendar - if someone mentions time/date/event, it's probably calendar
+Your task: Determine which feature should handle the user's message at the end of this prompt.
 
+{_ROUTING_RULES}
 Return ONLY valid JSON with this structure:
 {{
   "feature_index": <index of best matching feature, or null>,
@@ -158,14 +204,61 @@ Return ONLY valid JSON with this structure:
   "reasoning": "<brief explanation of why this feature matches>"
 }}
 
-Examples:
-- "Meeting tomorrow at 3pm" → calendar feature (high confidence)
-- After creating event, user says "make it 2 hours" → calendar feature (using context)
-- "Remind me to call mom" → reminder feature if available, else null
-- "What's the weather?" → weather feature if available, else null
-- "Random chat message" → conversation feature (low confidence)
+{_ROUTING_EXAMPLES}"""
+
+    def _build_routing_prompt(self, message_text, context=None):
+        """
+        Build the prompt for Gemini to route the message.
+
+        Args:
+            message_text (str): User's message
+            context (list): Optional conversation context
+
+        Returns:
+            str: Prompt for Gemini
+        """
+        # Format context if available
+        context_str = format_context(context)
+
+        return f'{self._prompt_prefix}{context_str}User message: "{message_text}"\n'
+
+    def _build_batch_routing_prompt(self, messages):
+        """
+        Build the prompt for routing several messages in one call.
+
+        Args:
+            messages (list): The user messages (str)
+
+        Returns:
+            str: Prompt for Gemini
+        """
+        numbered = "\n".join(f'{i}: "{message_text}"' for i, message_text in enumerate(messages))
+
+        return f"""
+You are an intelligent routing system for a personal assistant bot.
+
+Available features:
+{self._features_json}
+
+Your task: For EACH numbered user message below, determine which feature should handle it.
+The messages are unrelated to each other - route each one on its own.
+
+{_ROUTING_RULES}
+Return ONLY valid JSON with this structure, one entry per message:
+{{
+  "results": [
+    {{
+      "message_index": <number of the message>,
+      "feature_index": <index of best matching feature, or null>,
+      "confidence": <confidence level 0.0-1.0>
+    }}
+  ]
+}}
+
+{_ROUTING_EXAMPLES}
+Messages:
+{numbered}
 """
-        return prompt
 
     def get_feature_summary(self):
         """
@@ -6,9 +6,13 @@ Currently, the main authentication logic is in calendar_service.py
 but this can be extended for additional auth-related utilities.
 """
 
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
 def get_timezone():
     """
     Get the user's timezone.
     For now returns a default, but can be extended to detect or configure timezone.
+    Cached, so any future detection runs once per process.
     """
     return 'America/Los_Angeles'
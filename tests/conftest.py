@@ -7,23 +7,211 @@ all tests have access to API keys without needing to start the Discord bot.
 
 import sys
 import os
-
-# Make src/ importable (mirrors running `cd src && python bot.py`)
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
-
-from dotenv import load_dotenv
-load_dotenv(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.env')))
+import asyncio
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+ROOT = Path(__file__).resolve().parent.parent
+
+# pytest cache key: {nodeid: source digest} of live tests that last passed
+_LIVE_PASSED_KEY = "alfred/live_passed"
+_live_results = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-live", action="store_true",
+        help="run tests marked 'live' (real Gemini / Google API calls)"
+    )
+    parser.addoption(
+        "--skip-unchanged", action="store_true",
+        help="with --run-live, skip live tests that passed last time if src/ and the test file are unchanged"
+    )
+
+
+@lru_cache(maxsize=None)
+def _source_digest(test_file):
+    """Hash of all bot source plus the test file (and conftest) it runs from."""
+    h = hashlib.sha256()
+    for path in sorted((ROOT / "src").rglob("*.py")) + [ROOT / "tests" / "conftest.py", Path(test_file)]:
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-live"):
+        if config.getoption("--skip-unchanged"):
+            passed = config.cache.get(_LIVE_PASSED_KEY, {})
+            skip_unchanged = pytest.mark.skip(reason="passed last run, nothing changed (--skip-unchanged)")
+            for item in items:
+                if "live" in item.keywords and passed.get(item.nodeid) == _source_digest(str(item.path)):
+                    item.add_marker(skip_unchanged)
+        return
+    skip_live = pytest.mark.skip(reason="calls real APIs; run with --run-live")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+def pytest_runtest_logreport(report):
+    # Remember which live tests passed against which source (failures forget)
+    if report.when == "call" and "live" in report.keywords:
+        test_file = str(ROOT / report.location[0])
+        _live_results[report.nodeid] = _source_digest(test_file) if report.passed else None
+
+
+def pytest_sessionfinish(session):
+    # Under xdist, reports reach the controller too; only it writes the cache
+    if hasattr(session.config, "workerinput") or not _live_results:
+        return
+    passed = session.config.cache.get(_LIVE_PASSED_KEY, {})
+    for nodeid, digest in _live_results.items():
+        if digest is None:
+            passed.pop(nodeid, None)
+        else:
+            passed[nodeid] = digest
+    session.config.cache.set(_LIVE_PASSED_KEY, passed)
+
+
+def pytest_configure(config):
+    # Make src/ importable (mirrors running `cd src && python bot.py`)
+    src = str(ROOT / "src")
+    if src not in sys.path:
+        sys.path.insert(0, src)
+
+    # xdist workers inherit the controller's environment, so .env is read once
+    if not os.environ.get("_ALFRED_ENV_LOADED"):
+        from dotenv import load_dotenv
+        load_dotenv(ROOT / ".env")
+        os.environ["_ALFRED_ENV_LOADED"] = "1"
+
+
+def assert_textual(response, min_len=5):
+    """Assert a feature returned a real text reply (longer than min_len characters)."""
+    assert isinstance(response, str), f"expected str, got {type(response).__name__}"
+    assert len(response) > min_len, f"response too short: {response!r}"
+
+
+@pytest.fixture(scope="session")
+def vcr_config():
+    """
+    Settings for tests marked @pytest.mark.vcr (pytest-recording).
 
-@pytest.fixture
+    Real responses are recorded to tests/cassettes/ on the first run and
+    replayed afterwards. API keys and OAuth tokens are stripped before
+    anything is written. Requests are matched on their body too, because
+    every Gemini call POSTs to the same URL and concurrent calls can finish
+    in any order.
+    """
+    return {
+        "filter_headers": ["authorization", "x-goog-api-key"],
+        "filter_query_parameters": ["key"],
+        "match_on": ["method", "scheme", "host", "port", "path", "query", "body"],
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def _warm_gemini(request):
+    """
+    Make one cheap Gemini call on each of the client's APIs before the first
+    live test, so client setup and TLS handshakes aren't counted against
+    whichever test runs first. The features use the async API and the router
+    the sync one, and each keeps its own connection pool.
+    Skipped with --record-mode=none, where cassettes must answer every request.
+    """
+    if not request.config.getoption("--run-live"):
+        return
+    if request.config.getoption("--record-mode", default=None) == "none":
+        return
+    from config.bot_context import GEMINI_MODEL
+    from services.gemini_client import get_gemini_client
+    try:
+        client = get_gemini_client()
+        await asyncio.gather(
+            client.aio.models.count_tokens(model=GEMINI_MODEL, contents="warmup"),
+            asyncio.to_thread(client.models.count_tokens, model=GEMINI_MODEL, contents="warmup"),
+        )
+    except Exception as e:
+        logging.getLogger(__name__).warning("Gemini warm-up failed: %s", e)
+
+
+@pytest.fixture(scope="session")
 def mock_message():
-    """Minimal stand-in for a Discord message object."""
+    """Minimal stand-in for a Discord message object, shared by all tests."""
     msg = MagicMock()
     msg.author.id = 99999
     msg.author.name = "test_user"
     msg.reply = AsyncMock()
     msg.channel.send = AsyncMock()
     return msg
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_message(request):
+    """Clear recorded calls after each test so they don't leak into the next one."""
+    yield
+    if "mock_message" in request.fixturenames:
+        msg = request.getfixturevalue("mock_message")
+        msg.reply.reset_mock()
+        msg.channel.send.reset_mock()
+
+
+# ---------------------------------------------------------------------------
+# Features and router - built once per test session, like the running bot.
+# Imported here rather than at the top: src/ is only on sys.path once
+# pytest_configure has run.
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def calendar_feature():
+    from features.calendar_feature import CalendarFeature
+    return CalendarFeature()
+
+
+@pytest.fixture(scope="session")
+def fun_fact_feature():
+    from features.fun_fact_feature import FunFactFeature
+    return FunFactFeature()
+
+
+@pytest.fixture(scope="session")
+def youtube_feature():
+    from features.youtube_feature import YouTubeFeature
+    feature = YouTubeFeature()
+    yield feature
+    # __init__ creates the download dir; remove it unless it holds real downloads
+    try:
+        feature.temp_dir.rmdir()
+    except OSError:
+        pass
+
+
+@pytest.fixture(scope="session")
+def search_feature():
+    from features.search_feature import SearchFeature
+    return SearchFeature()
+
+
+@pytest.fixture(scope="session")
+def conversation_feature():
+    from features.conversation_feature import ConversationFeature
+    return ConversationFeature()
+
+
+@pytest.fixture(scope="session")
+def router(calendar_feature, fun_fact_feature, youtube_feature, search_feature, conversation_feature):
+    """Router with every feature registered, in the same order as discord_handler."""
+    from services.intent_router import IntentRouter
+
+    r = IntentRouter()
+    r.register_feature(calendar_feature)
+    r.register_feature(fun_fact_feature)
+    r.register_feature(youtube_feature)
+    r.register_feature(search_feature)
+    r.register_feature(conversation_feature)
+    return r
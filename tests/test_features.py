@@ -4,13 +4,20 @@ Tests for individual feature handlers.
 These call real Gemini and (for Calendar) the real Google Calendar API.
 YouTube is excluded — its handle() downloads files and sends them via Discord,
 which doesn't make sense outside of a real bot session.
+
+Skipped unless pytest is run with --run-live. Gemini-only feature responses are
+recorded once and replayed from tests/cassettes/ (see vcr_config in conftest.py).
+Calendar always runs live: its prompt carries the current time and its API
+queries the current dates, so a recording could never be replayed.
 """
 
+import asyncio
+
 import pytest
-from features.calendar_feature import CalendarFeature
-from features.search_feature import SearchFeature
-from features.conversation_feature import ConversationFeature
-from features.fun_fact_feature import FunFactFeature
+
+from conftest import assert_textual
+
+pytestmark = pytest.mark.live
 
 
 # ---------------------------------------------------------------------------
@@ -18,89 +25,61 @@ from features.fun_fact_feature import FunFactFeature
 # ---------------------------------------------------------------------------
 
 class TestCalendar:
-    @pytest.mark.asyncio
-    async def test_view_today(self, mock_message):
-        feature = CalendarFeature()
-        response = await feature.handle(mock_message, "what's on my calendar today?")
-        assert isinstance(response, str)
-        assert len(response) > 5
-
-    @pytest.mark.asyncio
-    async def test_view_specific_day(self, mock_message):
-        feature = CalendarFeature()
-        response = await feature.handle(mock_message, "what do I have next Monday?")
-        assert isinstance(response, str)
-        assert len(response) > 5
-
-    @pytest.mark.asyncio
-    async def test_bad_request_doesnt_crash(self, mock_message):
-        feature = CalendarFeature()
-        response = await feature.handle(mock_message, "asdfghjkl calendar???")
-        assert isinstance(response, str)
+    async def test_requests(self, mock_message, calendar_feature):
+        # All prompts at once: the Gemini + Calendar round-trips overlap
+        view_today, view_monday, bad_request = await asyncio.gather(
+            calendar_feature.handle(mock_message, "what's on my calendar today?"),
+            calendar_feature.handle(mock_message, "what do I have next Monday?"),
+            calendar_feature.handle(mock_message, "asdfghjkl calendar???"),
+        )
+        for response in (view_today, view_monday):
+            assert_textual(response)
+        # Bad request just must not crash
+        assert isinstance(bad_request, str)
 
 
 # ---------------------------------------------------------------------------
 # Search
 # ---------------------------------------------------------------------------
 
+@pytest.mark.vcr
 class TestSearch:
-    @pytest.mark.asyncio
-    async def test_factual_question(self, mock_message):
-        feature = SearchFeature()
-        response = await feature.handle(mock_message, "why do Muslims fast during Ramadan?")
-        assert isinstance(response, str)
-        assert len(response) > 20
-
-    @pytest.mark.asyncio
-    async def test_travel_time(self, mock_message):
-        feature = SearchFeature()
-        response = await feature.handle(mock_message, "travel time from San Diego to Los Angeles by car")
-        assert isinstance(response, str)
-        assert len(response) > 20
-
-    @pytest.mark.asyncio
-    async def test_how_to_question(self, mock_message):
-        feature = SearchFeature()
-        response = await feature.handle(mock_message, "how do I fix a merge conflict in git?")
-        assert isinstance(response, str)
-        assert len(response) > 20
+    async def test_answers_questions(self, mock_message, search_feature):
+        prompts = [
+            "why do Muslims fast during Ramadan?",
+            "travel time from San Diego to Los Angeles by car",
+            "how do I fix a merge conflict in git?",
+        ]
+        responses = await asyncio.gather(*(search_feature.handle(mock_message, p) for p in prompts))
+        for response in responses:
+            assert_textual(response, min_len=20)
 
 
 # ---------------------------------------------------------------------------
 # Fun Fact
 # ---------------------------------------------------------------------------
 
+@pytest.mark.vcr
 class TestFunFact:
-    @pytest.mark.asyncio
-    async def test_returns_a_fact(self, mock_message):
-        feature = FunFactFeature()
-        response = await feature.handle(mock_message, "tell me a fun fact")
-        assert isinstance(response, str)
-        assert len(response) > 20
-
-    @pytest.mark.asyncio
-    async def test_topical_fact(self, mock_message):
-        feature = FunFactFeature()
-        response = await feature.handle(mock_message, "give me a fun fact about space")
-        assert isinstance(response, str)
-        assert len(response) > 20
+    @pytest.mark.parametrize("prompt", [
+        "tell me a fun fact",
+        "give me a fun fact about space",
+    ])
+    async def test_returns_a_fact(self, mock_message, fun_fact_feature, prompt):
+        response = await fun_fact_feature.handle(mock_message, prompt)
+        assert_textual(response, min_len=20)
 
 
 # ---------------------------------------------------------------------------
 # Conversation
 # ---------------------------------------------------------------------------
 
+@pytest.mark.vcr
 class TestConversation:
-    @pytest.mark.asyncio
-    async def test_greeting(self, mock_message):
-        feature = ConversationFeature()
-        response = await feature.handle(mock_message, "hey alfred, how are you?")
-        assert isinstance(response, str)
-        assert len(response) > 5
-
-    @pytest.mark.asyncio
-    async def test_thanks(self, mock_message):
-        feature = ConversationFeature()
-        response = await feature.handle(mock_message, "thanks!")
-        assert isinstance(response, str)
-        assert len(response) > 5
+    @pytest.mark.parametrize("prompt", [
+        "hey alfred, how are you?",
+        "thanks!",
+    ])
+    async def test_replies(self, mock_message, conversation_feature, prompt):
+        response = await conversation_feature.handle(mock_message, prompt)
+        assert_textual(response)
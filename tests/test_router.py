@@ -3,29 +3,20 @@ Tests for the AI intent router.
 
 Verifies that the router correctly assigns messages to the right feature.
 These tests call real Gemini — they test routing logic, not mocked responses.
+Skipped unless pytest is run with --run-live.
+
+A live run makes 13 Gemini calls: one route() per case, since that is
+what the bot routes with, plus one route_batch() call for the same cases.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from services.intent_router import IntentRouter
-from features.calendar_feature import CalendarFeature
-from features.fun_fact_feature import FunFactFeature
-from features.youtube_feature import YouTubeFeature
-from features.search_feature import SearchFeature
-from features.conversation_feature import ConversationFeature
-
-
-@pytest.fixture
-def router():
-    r = IntentRouter()
-    r.register_feature(CalendarFeature())
-    r.register_feature(FunFactFeature())
-    r.register_feature(YouTubeFeature())
-    r.register_feature(SearchFeature())
-    r.register_feature(ConversationFeature())
-    return r
-
-
-@pytest.mark.parametrize("message,expected", [
+
+pytestmark = pytest.mark.live
+
+
+ROUTING_CASES = [
     # Calendar - create
     ("schedule a meeting tomorrow at 3pm", "Calendar"),
     ("add lunch with Sarah on Friday at noon", "Calendar"),
@@ -44,8 +35,24 @@ def router():
     # Conversation
     ("hey alfred how are you", "Conversation"),
     ("thanks!", "Conversation"),
-])
-def test_routing(router, message, expected):
-    result = router.route(message)
-    assert result is not None, f"Router returned None for: {message!r}"
-    assert result.name == expected, f"Expected {expected!r}, got {result.name!r} for: {message!r}"
+]
+
+
+def _names(results):
+    return {message: (result.name if result else None) for message, result in results}
+
+
+def test_routing_all(router):
+    # route() is what the bot uses; route every case in parallel so the
+    # Gemini round-trips overlap. On failure pytest diffs the dicts per message.
+    expected = dict(ROUTING_CASES)
+    with ThreadPoolExecutor(max_workers=len(expected)) as pool:
+        results = list(pool.map(router.route, expected))
+    assert _names(zip(expected, results)) == expected
+
+
+def test_route_batch(router):
+    # Same cases through the single batched call
+    expected = dict(ROUTING_CASES)
+    results = router.route_batch(list(expected))
+    assert _names(zip(expected, results)) == expected